@@ -1,42 +1,240 @@
 import argparse
+import asyncio
+import base64
+import csv
 import json
 import os
 import re
+import subprocess
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlsplit
 
-import pandas as pd
 import requests
-import yaml
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Selenium imports
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium import webdriver
+# Selenium, pandas, yaml and bs4 are imported lazily (see _import_selenium
+# and the load/save helpers) so requests-only runs and --help don't pay
+# their multi-second import cost up front.
+By = None
+WebDriverWait = None
+EC = None
+Options = None
+Service = None
+webdriver = None
+ChromeDriverManager = None
+_WEBDRIVER_MANAGER_AVAILABLE = False
+
+
+def _import_selenium():
+    global By, WebDriverWait, EC, Options, Service, webdriver
+    global ChromeDriverManager, _WEBDRIVER_MANAGER_AVAILABLE
+    if webdriver is not None:
+        return
+    from selenium.webdriver.common.by import By as _By
+    from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+    from selenium.webdriver.support import expected_conditions as _EC
+    from selenium.webdriver.chrome.options import Options as _Options
+    from selenium.webdriver.chrome.service import Service as _Service
+    from selenium import webdriver as _webdriver
+    By, WebDriverWait, EC = _By, _WebDriverWait, _EC
+    Options, Service, webdriver = _Options, _Service, _webdriver
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager as _ChromeDriverManager
+        ChromeDriverManager = _ChromeDriverManager
+        _WEBDRIVER_MANAGER_AVAILABLE = True
+    except Exception:
+        _WEBDRIVER_MANAGER_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _SELECTOLAX_AVAILABLE = True
+except Exception:
+    _SELECTOLAX_AVAILABLE = False
+
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except Exception:
+    _HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except Exception:
+    _ORJSON_AVAILABLE = False
+
+try:
+    # Superset of re with atomic groups / possessive quantifiers, which keep
+    # the open-ended feedback-section patterns from backtracking
+    import regex as _regex
+    _REGEX_AVAILABLE = True
+except Exception:
+    _REGEX_AVAILABLE = False
+
+
+def _compile_pattern(pattern, flags=0):
+    if _REGEX_AVAILABLE:
+        return _regex.compile(pattern, flags)
+    return re.compile(pattern, flags)
 
 try:
-    from webdriver_manager.chrome import ChromeDriverManager
-    _WEBDRIVER_MANAGER_AVAILABLE = True
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    _LXML_AVAILABLE = True
 except Exception:
-    _WEBDRIVER_MANAGER_AVAILABLE = False
+    _LXML_AVAILABLE = False
+
+_NUMERIC_RE = re.compile(r"[-+]?[0-9]*\.?[0-9]+")
+
+# Evaluates a list of XPath expressions in one driver round-trip instead of
+# one find_element call (5-30 ms each) per expression.
+_BATCH_XPATH_JS = """
+const results = [];
+for (const xp of arguments[0]) {
+    try {
+        const r = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+        results.push(r.singleNodeValue ? r.singleNodeValue.textContent : null);
+    } catch (e) {
+        results.push(null);
+    }
+}
+return results;
+"""
+
+# Per-process state for the parse worker pool (see _init_parse_worker)
+_worker_scraper = None
+_worker_field_config = None
+
+
+def _clean_field_config(field_config):
+    # Compiled regex/xpath objects under underscore keys don't all pickle;
+    # workers get the plain config and compile once per process.
+    clean = {}
+    for name, info in field_config.items():
+        entry = {k: v for k, v in info.items() if not k.startswith('_')}
+        transform = entry.get('transform')
+        if transform:
+            entry['transform'] = {k: v for k, v in transform.items() if not k.startswith('_')}
+        clean[name] = entry
+    return clean
+
+
+def _init_parse_worker(field_config):
+    global _worker_scraper, _worker_field_config
+    _worker_scraper = FlexibleWebScraper()
+    _worker_field_config = _worker_scraper._compile_field_config(field_config)
+
+
+def _parse_html_worker(html):
+    try:
+        return _worker_scraper.extract_data_requests(html, _worker_field_config)
+    except Exception as e:
+        print(f"Worker extraction failed: {e}")
+        return {}
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+_CHROMEDRIVER_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'flexible_scraper', 'chromedriver_path.json')
+
+
+def _detect_chrome_version():
+    for cmd in (['google-chrome', '--version'],
+                ['google-chrome-stable', '--version'],
+                ['chromium', '--version'],
+                ['chromium-browser', '--version']):
+        try:
+            out = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.strip()
+            if out:
+                return out
+        except Exception:
+            continue
+    return 'unknown'
+
+
+def _get_chromedriver_path():
+    # ChromeDriverManager().install() does CDN lookups and version checks on
+    # every call, so the resolved path is cached per process and persisted
+    # per Chrome version so later runs skip the lookup entirely.
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is not None:
+            return _chromedriver_path
+
+        chrome_version = _detect_chrome_version()
+        try:
+            with open(_CHROMEDRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('chrome_version') == chrome_version and os.path.exists(cached.get('driver_path', '')):
+                _chromedriver_path = cached['driver_path']
+                return _chromedriver_path
+        except Exception:
+            pass
+
+        _chromedriver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(os.path.dirname(_CHROMEDRIVER_CACHE_FILE), exist_ok=True)
+            with open(_CHROMEDRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'chrome_version': chrome_version, 'driver_path': _chromedriver_path}, f)
+        except Exception as e:
+            print(f"Could not cache chromedriver path: {e}")
+        return _chromedriver_path
+
+
+class _PerHostRateLimiter:
+    """Spaces out requests to the same host by a minimum delay."""
+
+    def __init__(self, delay_seconds):
+        self.delay = float(delay_seconds)
+        self._locks = {}
+        self._last_request = {}
+
+    async def wait(self, host):
+        if self.delay <= 0:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            ready_at = self._last_request.get(host, 0) + self.delay
+            if ready_at > now:
+                await asyncio.sleep(ready_at - now)
+            self._last_request[host] = time.monotonic()
 
 
 class FlexibleWebScraper:
     def __init__(self, config_file=None):
         self.config = self.load_config(config_file) if config_file else {}
+        # Records are stored as tuples aligned to the shared _columns list:
+        # per-dict hashtable overhead adds up fast on 100k-URL runs.
+        # iter_records() rebuilds dicts for consumers.
         self.data = []
+        self._columns = []
+        self._column_index = {}
         self.driver = None
         self.session = None
         self.save_screenshots = False
+        self._jsonl_fh = None
+        self._csv_fh = None
+        self._csv_writer = None
+        self._combined_source = None
+        self._combined_text_regex = None
+        self._combined_map = {}
+        self._screenshot_executor = None
+        selenium_cfg = self.config.get('selenium', {})
+        if selenium_cfg.get('reuse_driver'):
+            # Pre-warm the driver so the first URL doesn't pay the launch cost
+            self.setup_selenium(headless=selenium_cfg.get('headless', False),
+                                save_screenshots=selenium_cfg.get('save_screenshots', True))
 
     def load_config(self, config_file):
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 if config_file.endswith('.yaml') or config_file.endswith('.yml'):
+                    import yaml
                     return yaml.safe_load(f) or {}
                 return json.load(f) or {}
         except Exception as e:
@@ -44,23 +242,48 @@ class FlexibleWebScraper:
             return {}
 
     def setup_selenium(self, headless=False, save_screenshots=True, page_load_timeout=30):
+        _import_selenium()
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"]) 
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("--start-maximized")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+
+        # Text extraction doesn't need images, stylesheets or webfonts;
+        # skipping them cuts page-load time and memory dramatically. Turn
+        # block_resources off when screenshots need to look right.
+        block_resources = self.config.get('selenium', {}).get('block_resources', True)
+        if block_resources:
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.stylesheets': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+            })
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
 
         if _WEBDRIVER_MANAGER_AVAILABLE:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_get_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
         else:
             self.driver = webdriver.Chrome(options=chrome_options)
 
         self.driver.set_page_load_timeout(page_load_timeout)
+        if block_resources:
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                    'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp',
+                             '*.woff', '*.woff2', '*.ttf', '*.css']
+                })
+            except Exception:
+                pass
         self.save_screenshots = save_screenshots
         if self.save_screenshots:
             os.makedirs('screenshots', exist_ok=True)
@@ -68,13 +291,34 @@ class FlexibleWebScraper:
     def setup_requests_session(self):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Connection': 'keep-alive'
         })
+        # The default adapter pools only 10 connections and never retries;
+        # enlarge the pool so keep-alive connections are reused under load
+        # and transient 5xx/429 responses are retried with backoff.
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
     def scrape_with_multiple_methods(self, url, field_config, wait_css_selectors=None):
         extracted_data = {}
 
-        # Method 1: Selenium
+        # Plain requests is orders of magnitude cheaper than a browser page
+        # load, and these reports are usually server-rendered, so Selenium is
+        # the last resort. Either knob can put it first: javascript_required
+        # for JS-only pages, or turning selenium.only_on_failure off.
+        selenium_first = (bool(self.config.get('javascript_required'))
+                          or not self.config.get('selenium', {}).get('only_on_failure', True))
+
+        if not selenium_first:
+            data, success = self._try_requests_then_api(url, field_config)
+            if success:
+                return data
+            extracted_data = data
+
+        # Selenium (first only when JavaScript is required)
         try:
             if not self.driver:
                 self.setup_selenium(headless=self.config.get('selenium', {}).get('headless', False),
@@ -92,24 +336,59 @@ class FlexibleWebScraper:
                     except Exception:
                         pass
             else:
-                time.sleep(self.config.get('selenium', {}).get('sleep_after_load', 3))
+                # Wait for actual readiness instead of a fixed sleep: fast
+                # pages stop waiting immediately, slow ones get the full
+                # window. The old sleep remains the last-ditch fallback.
+                try:
+                    WebDriverWait(self.driver, self.config.get('selenium', {}).get('wait_seconds', 15)).until(
+                        lambda d: d.execute_script('return document.readyState') == 'complete'
+                    )
+                    self._wait_for_network_quiet()
+                except Exception:
+                    time.sleep(self.config.get('selenium', {}).get('sleep_after_load', 3))
 
             if self.save_screenshots:
-                ts = int(time.time())
-                self.driver.save_screenshot(f'screenshots/page_{ts}.png')
+                self._capture_screenshot(f'screenshots/page_{int(time.time())}.jpg')
+
+            html_content = self._get_rendered_html()
 
             if self.config.get('debug', {}).get('save_html', False):
                 with open(f'debug_html_{int(time.time())}.html', 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source)
+                    f.write(html_content)
 
-            extracted_data = self.extract_data_selenium(field_config)
+            extracted_data = self.extract_data_selenium(field_config, html_content=html_content)
             if self.is_extraction_successful(extracted_data):
                 print("✓ Selenium method successful")
                 return extracted_data
         except Exception as e:
             print(f"Selenium method failed: {e}")
+            # Keep the driver alive for the next URL instead of relaunching;
+            # only drop it when the session itself is dead.
+            try:
+                self.driver.delete_all_cookies()
+            except Exception:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+
+        if selenium_first:
+            # Requests + API still run as fallbacks when Selenium went first
+            data, success = self._try_requests_then_api(url, field_config)
+            if success or data:
+                extracted_data = data
+            if success:
+                return extracted_data
+
+        return extracted_data
 
-        # Method 2: Requests + BS4
+    def _try_requests_then_api(self, url, field_config):
+        """Attempt the requests method, then the configured API endpoint.
+
+        Returns (data, success): success is True when either method met the
+        extraction threshold; data holds the best effort otherwise."""
+        extracted_data = {}
         try:
             if not self.session:
                 self.setup_requests_session()
@@ -118,23 +397,22 @@ class FlexibleWebScraper:
                 extracted_data = self.extract_data_requests(response.text, field_config)
                 if self.is_extraction_successful(extracted_data):
                     print("✓ Requests method successful")
-                    return extracted_data
+                    return extracted_data, True
             else:
                 print(f"Requests got status {response.status_code}")
         except Exception as e:
             print(f"Requests method failed: {e}")
 
-        # Method 3: Custom API endpoint
         if 'api_endpoint' in self.config:
             try:
                 api_data = self.try_api_extraction()
                 if api_data:
                     print("✓ API method successful")
-                    return api_data
+                    return api_data, True
             except Exception as e:
                 print(f"API method failed: {e}")
 
-        return extracted_data
+        return extracted_data, False
 
     def try_api_extraction(self):
         if not self.session:
@@ -151,85 +429,323 @@ class FlexibleWebScraper:
         resp.raise_for_status()
         return resp.json()
 
-    def extract_data_selenium(self, field_config):
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        return self.extract_with_config(soup, field_config, method="selenium")
+    def make_soup(self, html_content):
+        # lxml is much faster than the stdlib parser on large report pages;
+        # fall back to html.parser if lxml isn't installed.
+        from bs4 import BeautifulSoup, FeatureNotFound
+        try:
+            return BeautifulSoup(html_content, 'lxml')
+        except FeatureNotFound:
+            return BeautifulSoup(html_content, 'html.parser')
+
+    def parse_html(self, html_content):
+        # Lexbor (selectolax) parses an order of magnitude faster than BS4
+        # and covers everything extract_with_config needs. BS4 stays as the
+        # fallback when selectolax isn't installed.
+        if _SELECTOLAX_AVAILABLE:
+            return LexborHTMLParser(html_content)
+        return self.make_soup(html_content)
+
+    @staticmethod
+    def _select_first_text(doc, selector):
+        if _SELECTOLAX_AVAILABLE and isinstance(doc, LexborHTMLParser):
+            el = doc.css_first(selector)
+            return el.text(strip=True) if el else None
+        el = doc.select_one(selector)
+        return el.get_text(strip=True) if el else None
+
+    @staticmethod
+    def _select_first_attr(doc, selector, attribute):
+        if _SELECTOLAX_AVAILABLE and isinstance(doc, LexborHTMLParser):
+            el = doc.css_first(selector)
+            return el.attributes.get(attribute) if el else None
+        el = doc.select_one(selector)
+        return el.get(attribute) if el else None
+
+    @staticmethod
+    def _doc_text(doc):
+        if _SELECTOLAX_AVAILABLE and isinstance(doc, LexborHTMLParser):
+            body = doc.body
+            return body.text(separator="\n") if body else ""
+        return doc.get_text("\n", strip=False)
+
+    def _capture_screenshot(self, path):
+        # CDP hands back already-compressed JPEG bytes, avoiding
+        # save_screenshot's synchronous PNG encode; the disk write is
+        # pushed to a single background thread so the scrape loop moves on.
+        try:
+            shot = self.driver.execute_cdp_cmd('Page.captureScreenshot', {'format': 'jpeg', 'quality': 60})
+            raw = base64.b64decode(shot['data'])
+        except Exception:
+            try:
+                self.driver.save_screenshot(os.path.splitext(path)[0] + '.png')
+            except Exception as e:
+                print(f"Screenshot failed: {e}")
+            return
+        if self._screenshot_executor is None:
+            self._screenshot_executor = ThreadPoolExecutor(max_workers=1)
+        self._screenshot_executor.submit(self._write_screenshot, path, raw)
+
+    @staticmethod
+    def _write_screenshot(path, raw):
+        try:
+            with open(path, 'wb') as f:
+                f.write(raw)
+        except Exception as e:
+            print(f"Screenshot write failed: {e}")
+
+    def _wait_for_network_quiet(self, timeout=5, poll_interval=0.25):
+        # The page is treated as idle once no new resource entries show up
+        # between two polls (readyState alone misses late XHR-driven content)
+        deadline = time.monotonic() + timeout
+        last_count = -1
+        while time.monotonic() < deadline:
+            try:
+                count = self.driver.execute_script("return performance.getEntriesByType('resource').length")
+            except Exception:
+                return
+            if count == last_count:
+                return
+            last_count = count
+            time.sleep(poll_interval)
+
+    def _get_rendered_html(self):
+        # A single in-page script call returns the rendered markup without
+        # driver.page_source's full re-serialization round-trip.
+        try:
+            return self.driver.execute_script("return document.documentElement.outerHTML")
+        except Exception:
+            return self.driver.page_source
+
+    def extract_data_selenium(self, field_config, html_content=None):
+        if html_content is None:
+            html_content = self._get_rendered_html()
+        doc = self.parse_html(html_content)
+        return self.extract_with_config(doc, field_config, method="selenium", html_content=html_content)
 
     def extract_data_requests(self, html_content, field_config):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        return self.extract_with_config(soup, field_config, method="requests")
+        doc = self.parse_html(html_content)
+        return self.extract_with_config(doc, field_config, method="requests", html_content=html_content)
+
+    def _compile_field_config(self, field_config):
+        # Compile text patterns and regex transforms once instead of leaning
+        # on re's small internal cache for every field on every page.
+        # Idempotent: already-compiled fields are skipped.
+        for field_info in field_config.values():
+            if '_compiled_text_patterns' in field_info:
+                continue
+            compiled = []
+            for pattern in field_info.get('text_patterns', []):
+                try:
+                    compiled.append(_compile_pattern(pattern, re.IGNORECASE | re.DOTALL))
+                except Exception as e:
+                    print(f"Skipping invalid text pattern {pattern!r}: {e}")
+            field_info['_compiled_text_patterns'] = compiled
+            compiled_xpath = []
+            if _LXML_AVAILABLE:
+                for expr in field_info.get('xpath', []):
+                    try:
+                        compiled_xpath.append(lxml_etree.XPath(expr))
+                    except Exception as e:
+                        print(f"Skipping invalid xpath {expr!r}: {e}")
+            field_info['_compiled_xpath'] = compiled_xpath
+            transform = field_info.get('transform')
+            if transform and transform.get('type') == 'regex':
+                try:
+                    transform['_compiled_pattern'] = _compile_pattern(transform['pattern'])
+                except Exception as e:
+                    print(f"Skipping invalid transform pattern {transform.get('pattern')!r}: {e}")
+        self._build_combined_text_regex(field_config)
+        return field_config
+
+    def _build_combined_text_regex(self, field_config):
+        # One alternation over every field's text patterns lets Strategy 3
+        # sweep the page text in a single linear scan instead of one scan per
+        # field per pattern. Group names map back to (field, pattern index).
+        if self._combined_source is field_config:
+            return
+        parts = []
+        mapping = {}
+        for fi, (field_name, field_info) in enumerate(field_config.items()):
+            for pj, pattern in enumerate(field_info['_compiled_text_patterns']):
+                name = f"f{fi}_{pj}"
+                parts.append(f"(?P<{name}>{pattern.pattern})")
+                mapping[name] = (field_name, pj)
+        combined = None
+        if parts:
+            try:
+                combined = _compile_pattern("|".join(parts), re.IGNORECASE | re.DOTALL)
+            except Exception as e:
+                print(f"Combined text regex unavailable, using per-pattern scans: {e}")
+        self._combined_source = field_config
+        self._combined_text_regex = combined
+        self._combined_map = mapping
+
+    def _scan_text_patterns(self, text_content, field_config):
+        # Single pass over the page text; returns the best (lowest pattern
+        # index) capture per field, or None when no combined regex exists.
+        if self._combined_text_regex is None:
+            return None
+        best = {}
+        for m in self._combined_text_regex.finditer(text_content):
+            field_name, priority = self._combined_map[m.lastgroup]
+            if field_name in best and best[field_name][0] <= priority:
+                continue
+            try:
+                # Re-anchor the individual pattern to recover its capture group
+                sub = field_config[field_name]['_compiled_text_patterns'][priority].match(text_content, m.start())
+                captured = sub.group(1).strip() if sub else ''
+            except Exception:
+                continue
+            if captured:
+                best[field_name] = (priority, captured)
+        results = {}
+        for field_name, (priority, captured) in best.items():
+            if priority > 0:
+                # A lower-priority hit can consume the text a higher-priority
+                # pattern would have matched, hiding it from the single pass;
+                # confirm against the better patterns before accepting.
+                for pattern in field_config[field_name]['_compiled_text_patterns'][:priority]:
+                    try:
+                        match = pattern.search(text_content)
+                        if match:
+                            better = match.group(1).strip()
+                            if better:
+                                captured = better
+                                break
+                    except Exception:
+                        continue
+            results[field_name] = captured
+        return results
 
-    def extract_with_config(self, soup, field_config, method="selenium"):
+    def extract_with_config(self, doc, field_config, method="selenium", html_content=None):
+        self._compile_field_config(field_config)
         extracted_data = {}
+        # Built lazily, at most once per page: walking the DOM for the full
+        # text is expensive and used to happen once per text-pattern field.
+        text_content = None
+        lxml_root = None
+        combined_matches = None
+        # Fields whose value is still missing after the in-process strategies
+        # get their XPaths evaluated in one batched driver call at the end.
+        pending_xpath = []
         for field_name, field_info in field_config.items():
             value = None
 
             # Strategy 1: CSS Selectors
             for selector in field_info.get('css_selectors', []):
                 try:
-                    el = soup.select_one(selector)
-                    if el:
-                        value = el.get_text(strip=True)
-                        if value:
-                            break
+                    value = self._select_first_text(doc, selector)
+                    if value:
+                        break
                 except Exception:
                     continue
 
-            # Strategy 2: XPath via Selenium only
-            if not value and method == "selenium":
-                for xpath in field_info.get('xpath', []):
+            # Strategy 2: XPath (compiled lxml when possible, ahead of the
+            # regex fallback because it targets markup, not full-page text)
+            if not value and field_info['_compiled_xpath'] and html_content is not None:
+                if lxml_root is None:
                     try:
-                        el = self.driver.find_element(By.XPATH, xpath)
-                        if el:
-                            text_val = el.text.strip()
-                            if text_val:
-                                value = text_val
-                                break
+                        lxml_root = lxml_html.fromstring(html_content)
                     except Exception:
-                        continue
+                        lxml_root = False
+                if lxml_root is not False:
+                    for xpath in field_info['_compiled_xpath']:
+                        try:
+                            results = xpath(lxml_root)
+                            if not isinstance(results, list):
+                                results = [results]
+                            for result in results:
+                                if hasattr(result, 'text_content'):
+                                    text_val = result.text_content()
+                                else:
+                                    text_val = str(result)
+                                text_val = text_val.strip()
+                                if text_val:
+                                    value = text_val
+                                    break
+                            if value:
+                                break
+                        except Exception:
+                            continue
 
             # Strategy 3: Text Pattern Matching
-            if not value:
-                text_content = soup.get_text("\n", strip=False)
-                for pattern in field_info.get('text_patterns', []):
-                    try:
-                        match = re.search(pattern, text_content, re.IGNORECASE | re.DOTALL)
-                        if match:
-                            captured = match.group(1).strip()
-                            if captured:
-                                value = captured
-                                break
-                    except Exception:
-                        continue
+            if not value and field_info['_compiled_text_patterns']:
+                if text_content is None:
+                    text_content = self._doc_text(doc)
+                    combined_matches = self._scan_text_patterns(text_content, field_config)
+                if combined_matches is not None:
+                    value = combined_matches.get(field_name)
+                if not value:
+                    # Per-pattern scan covers matches the single pass missed
+                    # (e.g. a header consumed by another field's match)
+                    for pattern in field_info['_compiled_text_patterns']:
+                        try:
+                            match = pattern.search(text_content)
+                            if match:
+                                captured = match.group(1).strip()
+                                if captured:
+                                    value = captured
+                                    break
+                        except Exception:
+                            continue
 
             # Strategy 4: Attribute Extraction
             if not value:
                 for attr_cfg in field_info.get('attributes', []):
                     try:
-                        el = soup.select_one(attr_cfg['selector'])
-                        if el:
-                            attr_val = el.get(attr_cfg['attribute'])
-                            if attr_val:
-                                value = attr_val
-                                break
+                        attr_val = self._select_first_attr(doc, attr_cfg['selector'], attr_cfg['attribute'])
+                        if attr_val:
+                            value = attr_val
+                            break
                     except Exception:
                         continue
 
+            if not value and method == "selenium" and field_info.get('xpath'):
+                pending_xpath.append((field_name, field_info))
+
             # Transformations
             if value and 'transform' in field_info:
                 value = self.apply_transform(value, field_info['transform'])
 
             extracted_data[field_name] = value if value else "Not Found"
 
+        if pending_xpath and self.driver is not None:
+            self._batch_xpath_fill(pending_xpath, extracted_data)
+
         return extracted_data
 
+    def _batch_xpath_fill(self, pending_xpath, extracted_data):
+        all_xpaths = []
+        spans = []
+        for field_name, field_info in pending_xpath:
+            xpaths = field_info['xpath']
+            spans.append((field_name, field_info, len(all_xpaths), len(xpaths)))
+            all_xpaths.extend(xpaths)
+        try:
+            results = self.driver.execute_script(_BATCH_XPATH_JS, all_xpaths)
+        except Exception:
+            return
+        for field_name, field_info, start, count in spans:
+            value = None
+            for text_val in results[start:start + count]:
+                if text_val and text_val.strip():
+                    value = text_val.strip()
+                    break
+            if value and 'transform' in field_info:
+                value = self.apply_transform(value, field_info['transform'])
+            if value:
+                extracted_data[field_name] = value
+
     def apply_transform(self, value, transform_config):
         ttype = transform_config.get('type')
         if ttype == 'regex':
-            pattern = transform_config['pattern']
             replacement = transform_config.get('replacement', '')
             try:
-                return re.sub(pattern, replacement, value)
+                compiled = transform_config.get('_compiled_pattern')
+                if compiled is not None:
+                    return compiled.sub(replacement, value)
+                return re.sub(transform_config['pattern'], replacement, value)
             except Exception:
                 return value
         if ttype == 'strip_chars':
@@ -237,7 +753,7 @@ class FlexibleWebScraper:
             return value.strip(chars) if chars is not None else value.strip()
         if ttype == 'convert_to_number':
             try:
-                numeric = re.findall(r"[-+]?[0-9]*\.?[0-9]+", value)
+                numeric = _NUMERIC_RE.findall(value)
                 return float(numeric[0]) if numeric else value
             except Exception:
                 return value
@@ -257,7 +773,6 @@ class FlexibleWebScraper:
             print("No data to save")
             return
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        df = pd.DataFrame(self.data)
 
         base_excel = f"{filename_base}_{timestamp}.xlsx"
         base_csv = f"{filename_base}_{timestamp}.csv"
@@ -272,44 +787,220 @@ class FlexibleWebScraper:
             csv_file = base_csv
             json_file = base_json
 
-        try:
-            df.to_excel(excel_file, index=False, engine='openpyxl')
-            print(f"Saved Excel: {excel_file}")
-        except Exception as e:
-            print(f"Excel save failed: {e}")
+        fieldnames = list(self._columns)
+        records = list(self.iter_records())
 
-        try:
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-            print(f"Saved CSV: {csv_file}")
-        except Exception as e:
-            print(f"CSV save failed: {e}")
+        def write_excel():
+            try:
+                import pandas as pd
+                df = pd.DataFrame(records, columns=fieldnames)
+                df.to_excel(excel_file, index=False, engine='openpyxl')
+                print(f"Saved Excel: {excel_file}")
+            except Exception as e:
+                print(f"Excel save failed: {e}")
 
-        try:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
-            print(f"Saved JSON: {json_file}")
-        except Exception as e:
-            print(f"JSON save failed: {e}")
+        def write_csv():
+            try:
+                with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+                    writer.writeheader()
+                    writer.writerows(records)
+                print(f"Saved CSV: {csv_file}")
+            except Exception as e:
+                print(f"CSV save failed: {e}")
+
+        def write_json():
+            try:
+                if _ORJSON_AVAILABLE:
+                    with open(json_file, 'wb') as f:
+                        f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(json_file, 'w', encoding='utf-8') as f:
+                        json.dump(records, f, ensure_ascii=False, indent=2)
+                print(f"Saved JSON: {json_file}")
+            except Exception as e:
+                print(f"JSON save failed: {e}")
+
+        # Excel via openpyxl is by far the slowest writer, so it's opt-in;
+        # the remaining writers overlap their I/O in a small thread pool.
+        writers = [write_csv, write_json]
+        if self.config.get('output', {}).get('excel', False):
+            writers.append(write_excel)
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            futures = [executor.submit(w) for w in writers]
+            for future in futures:
+                future.result()
 
     def add_new_fields_dynamically(self, new_field_config):
         if hasattr(self, 'field_config'):
             self.field_config.update(new_field_config)
         return new_field_config
 
+    async def _fetch(self, client, url, semaphore, rate_limiter):
+        async with semaphore:
+            await rate_limiter.wait(urlsplit(url).netloc)
+            try:
+                response = await client.get(url)
+                if response.status_code == 200:
+                    return response.text
+                print(f"Async fetch of {url} got status {response.status_code}")
+            except Exception as e:
+                print(f"Async fetch of {url} failed: {e}")
+            return None
+
+    async def _bulk_scrape_async(self, url_list, field_config):
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        semaphore = asyncio.Semaphore(int(self.config.get('concurrency', 10)))
+        rate_limiter = _PerHostRateLimiter(self.config.get('politeness_delay_seconds', 2))
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        try:
+            client = httpx.AsyncClient(http2=True, headers=headers, follow_redirects=True,
+                                       timeout=30, limits=limits)
+        except ImportError:
+            # http2 support needs the optional h2 package
+            client = httpx.AsyncClient(headers=headers, follow_redirects=True, timeout=30, limits=limits)
+        async with client:
+            tasks = [self._fetch(client, url, semaphore, rate_limiter) for url in url_list]
+            return await asyncio.gather(*tasks)
+
     def bulk_scrape_urls(self, url_list, field_config):
+        # Fast path: fetch everything concurrently over plain HTTP and only
+        # fall back to the sequential Selenium/API pipeline for URLs whose
+        # extraction comes back empty. Requires httpx; API-endpoint configs
+        # keep the original sequential flow.
+        self._setup_stream_writers(field_config)
+        if _HTTPX_AVAILABLE and 'api_endpoint' not in self.config:
+            pages = asyncio.run(self._bulk_scrape_async(url_list, field_config))
+            extracted = self._extract_pages(url_list, pages, field_config)
+            fallback_urls = []
+            for url, data in zip(url_list, extracted):
+                if self.is_extraction_successful(data):
+                    self._record_result(url, data)
+                else:
+                    fallback_urls.append(url)
+            if fallback_urls:
+                print(f"Retrying {len(fallback_urls)} URL(s) with the sequential pipeline")
+                self._bulk_scrape_sequential(fallback_urls, field_config)
+            return
+
+        self._bulk_scrape_sequential(url_list, field_config)
+
+    def _extract_pages(self, url_list, pages, field_config):
+        # Parsing + regex extraction is CPU-bound, so once the async fetch
+        # has delivered enough pages it's worth spreading the work over a
+        # process pool; only raw HTML strings cross the process boundary.
+        indexed = [(i, html) for i, html in enumerate(pages) if html is not None]
+        extracted = [{} for _ in url_list]
+        parse_workers = int(self.config.get('parse_workers', os.cpu_count() or 1))
+        if parse_workers > 1 and len(indexed) > parse_workers:
+            try:
+                with ProcessPoolExecutor(max_workers=parse_workers,
+                                         initializer=_init_parse_worker,
+                                         initargs=(_clean_field_config(field_config),)) as pool:
+                    results = pool.map(_parse_html_worker, [html for _, html in indexed])
+                    for (i, _), data in zip(indexed, results):
+                        extracted[i] = data
+                    return extracted
+            except Exception as e:
+                print(f"Parallel parsing failed, extracting inline: {e}")
+        for i, html in indexed:
+            try:
+                extracted[i] = self.extract_data_requests(html, field_config)
+            except Exception as e:
+                print(f"Extraction failed for {url_list[i]}: {e}")
+        return extracted
+
+    def _bulk_scrape_sequential(self, url_list, field_config):
         for i, url in enumerate(url_list):
             print(f"Scraping URL {i+1}/{len(url_list)}: {url}")
             try:
                 data = self.scrape_with_multiple_methods(url, field_config,
                                                          wait_css_selectors=self.config.get('wait_css_selectors'))
-                data['source_url'] = url
-                data['scraped_at'] = datetime.now().isoformat()
-                self.data.append(data)
+                self._record_result(url, data)
                 time.sleep(self.config.get('politeness_delay_seconds', 2))
             except Exception as e:
                 print(f"Failed to scrape {url}: {e}")
 
+    def _setup_stream_writers(self, field_config):
+        # Append-as-you-go files so a crash mid-run loses at most one record
+        # and long runs don't have to hold everything for the final save.
+        if not self.config.get('stream_output', True) or self._jsonl_fh:
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = self.config.get('output_dir') or '.'
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            base = os.path.join(output_dir, f"scraped_stream_{timestamp}")
+            self._jsonl_fh = open(f"{base}.jsonl", 'a', encoding='utf-8')
+            self._csv_fh = open(f"{base}.csv", 'a', encoding='utf-8-sig', newline='')
+            # Seed the columns from the field config rather than the first
+            # record: a failed first URL would otherwise freeze the header
+            # at source_url/scraped_at and drop every later field value.
+            fieldnames = list(field_config) + ['source_url', 'scraped_at']
+            self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=fieldnames,
+                                              extrasaction='ignore', restval='')
+            self._csv_writer.writeheader()
+            self._csv_fh.flush()
+        except Exception as e:
+            print(f"Could not open stream output files: {e}")
+            self._jsonl_fh = None
+            self._csv_fh = None
+            self._csv_writer = None
+
+    def _stream_record(self, data):
+        if self._jsonl_fh:
+            try:
+                if _ORJSON_AVAILABLE:
+                    self._jsonl_fh.write(orjson.dumps(data).decode() + '\n')
+                else:
+                    self._jsonl_fh.write(json.dumps(data, ensure_ascii=False) + '\n')
+                self._jsonl_fh.flush()
+            except Exception as e:
+                print(f"JSONL stream write failed: {e}")
+        if self._csv_writer:
+            try:
+                self._csv_writer.writerow(data)
+                self._csv_fh.flush()
+            except Exception as e:
+                print(f"CSV stream write failed: {e}")
+
+    def _close_stream_writers(self):
+        for fh in (self._jsonl_fh, self._csv_fh):
+            if fh:
+                try:
+                    fh.close()
+                except Exception:
+                    pass
+        self._jsonl_fh = None
+        self._csv_fh = None
+        self._csv_writer = None
+
+    def _compact_record(self, data):
+        for key in data:
+            if key not in self._column_index:
+                self._column_index[key] = len(self._columns)
+                self._columns.append(key)
+        return tuple(data.get(column) for column in self._columns)
+
+    def iter_records(self):
+        for row in self.data:
+            yield {column: value for column, value in zip(self._columns, row) if value is not None}
+
+    def _record_result(self, url, data):
+        data['source_url'] = url
+        data['scraped_at'] = datetime.now().isoformat()
+        self.data.append(self._compact_record(data))
+        self._stream_record(data)
+
     def close(self):
+        if self._screenshot_executor:
+            try:
+                self._screenshot_executor.shutdown(wait=True)
+            except Exception:
+                pass
+            self._screenshot_executor = None
         if self.driver:
             try:
                 self.driver.quit()
@@ -320,6 +1011,7 @@ class FlexibleWebScraper:
                 self.session.close()
             except Exception:
                 pass
+        self._close_stream_writers()
 
 
 def create_default_config():
@@ -330,7 +1022,11 @@ def create_default_config():
             'headless': False,
             'save_screenshots': True,
             'sleep_after_load': 3,
-            'wait_seconds': 15
+            'wait_seconds': 15,
+            'only_on_failure': True
+        },
+        'output': {
+            'excel': False
         },
         'debug': {
             'save_html': False
@@ -399,13 +1095,15 @@ def create_sample_field_config():
             'transform': {'type': 'convert_to_number'}
         },
         'Strong Points': {
-            'text_patterns': [r'Strong Points[-:\s]*([\s\S]*?)(?:Areas Of Improvement|Overall Feedback|$)']
+            # Tempered token instead of a lazy [\s\S]*? so long pages scan
+            # linearly instead of backtracking per character
+            'text_patterns': [r'Strong Points[-:\s]*((?:(?!Areas Of Improvement|Overall Feedback).)*)']
         },
         'Areas Of Improvement': {
-            'text_patterns': [r'Areas Of Improvement[-:\s]*([\s\S]*?)(?:Strong Points|Overall Feedback|$)']
+            'text_patterns': [r'Areas Of Improvement[-:\s]*((?:(?!Strong Points|Overall Feedback).)*)']
         },
         'Overall Feedback': {
-            'text_patterns': [r'Overall Feedback[-:\s]*([\s\S]*?)$']
+            'text_patterns': [r'Overall Feedback[-:\s]*([\s\S]*)$']
         }
     }
 
@@ -426,6 +1124,7 @@ def load_field_config(path):
         return create_sample_field_config()
     with open(path, 'r', encoding='utf-8') as f:
         if path.endswith('.yaml') or path.endswith('.yml'):
+            import yaml
             return yaml.safe_load(f)
         return json.load(f)
 
@@ -450,15 +1149,16 @@ def main():
         print("Provide a --url or --url-file with at least one URL.")
         return
 
-    scraper.bulk_scrape_urls(urls, field_config)
-
-    # Resolve output directory preference: CLI > config > default "outputs"
+    # Resolve output directory preference: CLI > config > default "outputs".
+    # Done before scraping so the stream writers and save_data agree on it.
     output_dir = args.out_dir or (scraper.config or {}).get('output_dir') or 'outputs'
-    if output_dir:
-        try:
-            os.makedirs(output_dir, exist_ok=True)
-        except Exception as e:
-            print(f"Could not create output directory '{output_dir}': {e}")
+    scraper.config['output_dir'] = output_dir
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except Exception as e:
+        print(f"Could not create output directory '{output_dir}': {e}")
+
+    scraper.bulk_scrape_urls(urls, field_config)
 
     scraper.save_data(args.out, output_dir=output_dir)
     scraper.close()